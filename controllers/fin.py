@@ -20,6 +20,16 @@ def index():
 def expense():
     """ RESTful CRUD controller """
 
+    def prep(r):
+
+        # Bulk-represent the organisation of the author
+        # (auth_user.organisation_id has no representation by default)
+        utable = auth.settings.table_user
+        utable.organisation_id.represent = s3db.org_OrganisationRepresent()
+
+        return True
+    s3.prep = prep
+
     return s3_rest_controller()
 
 # -----------------------------------------------------------------------------
@@ -421,6 +421,13 @@ if len(pop_list) > 0:
         # autovacuum should be on anyway so will run ANALYZE after 50 rows inserted/updated/deleted
         #db.executesql("VACUUM ANALYZE;")
 
+    if has_module("fin"):
+        # Finance
+        # Add extra indexes on sort fields
+        # Should work for our 3 supported databases: sqlite, MySQL & PostgreSQL
+        db.executesql("CREATE INDEX fin_expense_date__idx on fin_expense(date);")
+        db.executesql("CREATE INDEX fin_payment_service_name__idx on fin_payment_service(name);")
+
     # =========================================================================
     info("\n*** FIRST RUN COMPLETE ***\n")
 
@@ -53,6 +53,11 @@ class FinExpensesModel(S3Model):
         # -------------------------------------------------------------------------
         # Expenses
         #
+        # Bulk-represent created_by (one query per list page instead of one per user)
+        user_represent = self.auth_UserRepresent(show_email = False,
+                                                 show_link = False,
+                                                 )
+
         tablename = "fin_expense"
         self.define_table(tablename,
                           self.super_link("doc_id", "doc_entity"),
@@ -69,7 +74,7 @@ class FinExpensesModel(S3Model):
                           s3_comments(),
                           *s3_meta_fields(),
                           on_define = lambda table: \
-                            [table.created_by.set_attributes(represent = s3_auth_user_represent_name),
+                            [table.created_by.set_attributes(represent = user_represent),
                              #table.created_on.set_attributes(represent = S3DateTime.datetime_represent),
                              ]
                           )
@@ -37,3 +37,16 @@ try:
 except:
     # Index already present
     pass
+
+if settings.has_module("fin"):
+    # Finance
+    try:
+        db.executesql("CREATE INDEX fin_expense_date__idx on fin_expense(date);")
+    except:
+        # Index already present
+        pass
+    try:
+        db.executesql("CREATE INDEX fin_payment_service_name__idx on fin_payment_service(name);")
+    except:
+        # Index already present
+        pass